@@ -4,14 +4,60 @@ PERFORMANCE AND LOAD TESTER FOR WEBSERV
 Tests server performance, concurrency, and resource limits
 """
 
+import array
+import math
+import selectors
 import socket
 import time
 import sys
 import threading
 import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Tuple
+from collections import defaultdict
+from typing import List, Dict, Tuple, Optional, Sequence
 import json
+import queue
+import os
+import multiprocessing
+from multiprocessing import shared_memory
+import re
+
+# Requests are pre-encoded once; nothing on the hot path calls .encode()
+GET_ROOT = b"GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
+KEEPALIVE_ROOT = b"GET / HTTP/1.1\r\nHost: localhost\r\nConnection: keep-alive\r\n\r\n"
+KEEPALIVE_GET = b"GET /index.html HTTP/1.1\r\nHost: localhost\r\nConnection: keep-alive\r\n\r\n"
+# Status code from the status line; the regex scan runs in C over the raw
+# bytes, with no decode of the whole response and no split() lists
+_STATUS_RE = re.compile(rb'[^ \t\r\n]+[ \t]+(\d+)(?![^ \t\r\n])')
+
+# Responses past this size are cut short
+RESPONSE_LIMIT = 1024 * 1024
+
+_CONTENT_LENGTH_RE = re.compile(rb'\r\ncontent-length:[ \t]*(\d+)', re.IGNORECASE)
+_CONNECTION_CLOSE_RE = re.compile(rb'\r\nconnection:[ \t]*close', re.IGNORECASE)
+
+# Requested SO_SNDBUF/SO_RCVBUF; Linux doubles it for bookkeeping and clamps it to net.core.[rw]mem_max
+SOCKET_BUFFER = 4 * 1024 * 1024
+# Seconds between stress-test progress updates
+PROGRESS_INTERVAL = 0.2
+PROGRESS_FMT = b"\rProgress: %d requests, %.1f req/s"
+# Upload bodies are streamed from this one preallocated block
+UPLOAD_CHUNK = memoryview(b"x" * 65536)
+UPLOAD_HEAD = b"POST /uploads/ HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/octet-stream\r\nContent-Length: %d\r\n\r\n"
+
+def body_length(buf, start: int, header_end: int, head_request=False) -> int:
+    """Body size announced by the header in buf[start:header_end] (0 if none)"""
+    if head_request:
+        return 0
+    match = _CONTENT_LENGTH_RE.search(buf, start, header_end)
+    return int(match.group(1)) if match else 0
+
+def response_end(buf, start=0):
+    """Offset just past the response that begins at start, or None if incomplete"""
+    header_end = buf.find(b'\r\n\r\n', start)
+    if header_end == -1:
+        return None
+    end = header_end + 4 + body_length(buf, start, header_end)
+    return end if len(buf) >= end else None
 
 class Colors:
     GREEN = '\033[92m'
@@ -24,204 +70,477 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
 
+class Probe:
+    """One request in flight on a nonblocking socket, advanced by selector events"""
+    CONNECTING, SENDING, READING = range(3)
+    __slots__ = ('sock', 'request', 'state', 'head_request', 'buf', 'expected',
+                 't0', 'deadline')
+    
+    def __init__(self, sock: socket.socket, request: bytes, timeout_ns: int):
+        self.sock = sock
+        self.request = memoryview(request)
+        self.state = Probe.CONNECTING
+        self.head_request = request.startswith(b"HEAD ")
+        self.buf = bytearray()
+        self.expected = None  # full response length, once the header is in
+        self.t0 = time.perf_counter_ns()
+        self.deadline = self.t0 + timeout_ns
+    
+    def on_writable(self) -> bool:
+        """Finish connecting and send what the socket takes; True once all is sent"""
+        if self.state == Probe.CONNECTING:
+            error = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if error:
+                raise OSError(error, os.strerror(error))
+            self.state = Probe.SENDING
+        self.request = self.request[self.sock.send(self.request):]
+        if self.request:
+            return False
+        self.state = Probe.READING
+        return True
+    
+    def on_readable(self) -> bool:
+        """Drain what has arrived; True once the response is complete enough"""
+        while True:
+            try:
+                chunk = self.sock.recv(65536)
+            except BlockingIOError:
+                return False
+            if not chunk:
+                return True
+            scanned = max(0, len(self.buf) - 3)
+            self.buf += chunk
+            if self.expected is None:
+                header_end = self.buf.find(b'\r\n\r\n', scanned)
+                if header_end != -1:
+                    self.expected = header_end + 4 + body_length(self.buf, 0, header_end,
+                                                                 self.head_request)
+            if len(self.buf) >= min(self.expected or RESPONSE_LIMIT, RESPONSE_LIMIT):
+                return True
+
+class ConnectionPool:
+    """Idle keep-alive connections to one server, most recently used first"""
+    
+    def __init__(self, connect, size=8):
+        self._connect = connect  # callable(timeout) -> connected socket
+        self._idle = queue.LifoQueue(size)
+    
+    def get(self, timeout) -> Tuple[socket.socket, bool]:
+        """An idle connection if there is one, else a new one; and whether it was reused"""
+        try:
+            sock = self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect(timeout), False
+        sock.settimeout(timeout)
+        return sock, True
+    
+    def put(self, sock: socket.socket):
+        """Hand a connection back for reuse, closing it if the pool is full"""
+        try:
+            self._idle.put_nowait(sock)
+        except queue.Full:
+            sock.close()
+    
+    def close(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
 class PerformanceTester:
-    def __init__(self, host='localhost', port=8080):
+    def __init__(self, host='localhost', port=8080, processes=1, pipeline=False, pool=False):
         self.host = host
         self.port = port
+        self.processes = max(1, processes)
+        self.pipeline = pipeline
+        # Opt-in: reusing connections measures per-request cost, not connect cost
+        self.pool = ConnectionPool(self._connect) if pool else None
         self.results = []
+        # Receive buffer reused by send_single_request; only one sync request
+        # runs at a time per instance (worker processes get their own)
+        self._rxbuf = bytearray(RESPONSE_LIMIT)
+        self._rxview = memoryview(self._rxbuf)
+        # Resolve the host once; connecting by numeric address skips the
+        # getaddrinfo (/etc/hosts, nsswitch) lookup on every request
+        try:
+            self._address = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+        except socket.gaierror:
+            self._address = (host, port)  # let connect() report the failure
+    
+    @staticmethod
+    def _new_socket(timeout) -> socket.socket:
+        """Create a client socket with Nagle off and enlarged kernel buffers"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER)
+        sock.settimeout(timeout)
+        return sock
+    
+    def warm_up(self, num_requests=200):
+        """Fire throwaway requests so the first measured phase doesn't pay
+        for cold caches, lazy initialisation or first-touch page faults"""
+        for offset in range(0, RESPONSE_LIMIT, 4096):
+            self._rxbuf[offset] = 0
+        for _ in range(num_requests):
+            try:
+                self._exchange(self._stress_request(), timeout=1.0, pooled=True)
+            except OSError:
+                pass
+        self._drive_requests(GET_ROOT, min(num_requests, 50), 10, timeout=1.0)
+        print(f"{Colors.DIM}Warm-up: {num_requests} requests discarded{Colors.RESET}")
+    
+    def report_socket_buffers(self):
+        """Show the buffer sizes the kernel actually granted"""
+        sock = self._new_socket(None)
+        rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        sndbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+        sock.close()
+        print(f"{Colors.DIM}Socket buffers: rcv {rcvbuf} / snd {sndbuf} bytes "
+              f"(requested {SOCKET_BUFFER}){Colors.RESET}")
         
-    def send_single_request(self, request: str, timeout=5.0) -> Dict:
-        """Send a single request and measure performance"""
-        start_time = time.time()
+    def send_single_request(self, request: bytes, timeout=5.0, body_size=0) -> Dict:
+        """Send a single request and measure performance (timings in ns)
+        
+        body_size bytes of filler follow request, streamed from UPLOAD_CHUNK.
+        """
+        t0 = time.perf_counter_ns()
         
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            
-            connect_start = time.time()
-            sock.connect((self.host, self.port))
-            connect_time = time.time() - connect_start
-            
-            send_start = time.time()
-            sock.sendall(request.encode())
-            send_time = time.time() - send_start
-            
-            response_start = time.time()
-            response = b""
-            while True:
-                try:
-                    chunk = sock.recv(8192)
-                    if not chunk:
-                        break
-                    response += chunk
-                    if len(response) > 1024*1024:  # 1MB limit
-                        break
-                    if b'\r\n\r\n' in response and len(response) > 100:
-                        break
-                except socket.timeout:
-                    break
-            
-            response_time = time.time() - response_start
-            sock.close()
-            
-            total_time = time.time() - start_time
-            
-            # Parse status code
-            status_code = None
-            if response:
-                try:
-                    status_line = response.decode('utf-8', errors='ignore').split('\n')[0]
-                    parts = status_line.split()
-                    if len(parts) >= 2 and parts[1].isdigit():
-                        status_code = int(parts[1])
-                except:
-                    pass
-            
+            t1, t2, t3, size, status_code = self._exchange(request, timeout, body_size)
             return {
                 'success': True,
                 'status_code': status_code,
-                'total_time': total_time,
-                'connect_time': connect_time,
-                'send_time': send_time,
-                'response_time': response_time,
-                'response_size': len(response)
+                'total_ns': t3 - t0,
+                'connect_ns': t1 - t0,
+                'send_ns': t2 - t1,
+                'response_ns': t3 - t2,
+                'response_size': size
             }
             
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e),
-                'total_time': time.time() - start_time
+                'total_ns': time.perf_counter_ns() - t0
             }
     
-    def concurrent_requests_test(self, num_requests=100, num_threads=10):
-        """Test concurrent request handling"""
-        print(f"\n{Colors.BOLD}Testing Concurrent Requests:{Colors.RESET}")
-        print(f"Requests: {num_requests}, Threads: {num_threads}")
+    def _connect(self, timeout) -> socket.socket:
+        """A new tuned connection to the server"""
+        sock = self._new_socket(timeout)
+        try:
+            sock.connect(self._address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    
+    def _exchange(self, request: bytes, timeout=5.0, body_size=0,
+                  pooled=False) -> Tuple[int, int, int, int, Optional[int]]:
+        """Run one request; return the (connected, sent, received) timestamps,
+        response size and status code. Raises OSError.
+        
+        With pooled=True and a pool configured, request must ask for keep-alive
+        and the connection comes from (and goes back to) the pool.
+        """
+        if pooled and self.pool is not None:
+            return self._pooled_exchange(request, timeout, body_size)
+        with self._connect(timeout) as sock:
+            t1 = time.perf_counter_ns()
+            t2, t3, size, status_code, _ = self._round_trip(sock, request, body_size)
+        return t1, t2, t3, size, status_code
+    
+    def _pooled_exchange(self, request: bytes, timeout, body_size) -> Tuple[int, int, int, int, Optional[int]]:
+        """_exchange() over a pooled keep-alive connection"""
+        while True:
+            sock, reused = self.pool.get(timeout)
+            t1 = time.perf_counter_ns()
+            try:
+                t2, t3, size, status_code, reusable = self._round_trip(sock, request, body_size)
+            except OSError:
+                sock.close()
+                if reused:
+                    continue  # the server dropped the idle connection; try another
+                raise
+            if reused and not size:
+                sock.close()
+                continue
+            if reusable:
+                self.pool.put(sock)
+            else:
+                sock.close()
+            return t1, t2, t3, size, status_code
+    
+    def _round_trip(self, sock: socket.socket, request: bytes, body_size) -> Tuple[int, int, int, Optional[int], bool]:
+        """Send request (plus body_size filler bytes) and read one response;
+        return the sent and received timestamps, response size, status code
+        and whether the connection can carry another request"""
+        sock.sendall(request)
+        remaining = body_size
+        while remaining > 0:
+            block = UPLOAD_CHUNK[:remaining]
+            sock.sendall(block)
+            remaining -= len(block)
+        t2 = time.perf_counter_ns()
+        
+        # Receive straight into the instance buffer, with no bytes object
+        # per chunk; only the new data plus the 3 bytes before it can
+        # complete the header terminator. Once it has, Content-Length says
+        # exactly where the response ends.
+        rxbuf, view = self._rxbuf, self._rxview
+        head_request = request.startswith(b"HEAD ")
+        offset = 0
+        end = RESPONSE_LIMIT
+        header_end = -1
+        while offset < end:
+            try:
+                received = sock.recv_into(view[offset:end])
+            except socket.timeout:
+                break
+            if not received:
+                break
+            if header_end == -1:
+                header_end = rxbuf.find(b'\r\n\r\n', max(0, offset - 3), offset + received)
+                if header_end != -1:
+                    end = min(end, header_end + 4 + body_length(rxbuf, 0, header_end, head_request))
+            offset += received
+        t3 = time.perf_counter_ns()
+        
+        reusable = (header_end != -1 and offset == end
+                    and not _CONNECTION_CLOSE_RE.search(rxbuf, 0, header_end))
+        return t2, t3, offset, self.parse_status(rxbuf, offset), reusable
+    
+    @staticmethod
+    def parse_status(response, end=None) -> Optional[int]:
+        """Extract the status code from a raw response (up to end), or None"""
+        if end is None:
+            end = len(response)
+        # "HTTP/1.1 200 ..." puts the code at a fixed offset; only unusual
+        # status lines fall through to the regex
+        if end >= 13 and response[8] == 0x20 and response[12] in (0x20, 0x0D):
+            code = response[9:12]
+            if code.isdigit():
+                return int(code)
+        match = _STATUS_RE.match(response, 0, end)
+        return int(match.group(1)) if match else None
+    
+    def _drive_requests(self, request: bytes, num_requests: int, concurrency: int,
+                        timeout=5.0) -> Tuple[array.array, Dict[str, int]]:
+        """Issue num_requests copies of request, at most concurrency at a time;
+        return the total times (ns) of the successes and a count per error
         
-        request = "GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
-        results = []
+        Every connection is a nonblocking socket pumped by one selector, so
+        thousands can be in flight without a thread apiece.
+        """
+        selector = selectors.DefaultSelector()
+        times = array.array('q')
+        errors = defaultdict(int)
+        timeout_ns = int(timeout * 1e9)
+        started = 0
         
-        start_time = time.time()
+        def start():
+            probe = Probe(self._new_socket(0), request, timeout_ns)
+            probe.sock.connect_ex(self._address)
+            selector.register(probe.sock, selectors.EVENT_WRITE, probe)
         
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            futures = [executor.submit(self.send_single_request, request) for _ in range(num_requests)]
+        def finish(probe, error=None):
+            selector.unregister(probe.sock)
+            probe.sock.close()
+            if error is None:
+                times.append(time.perf_counter_ns() - probe.t0)
+            else:
+                errors[error] += 1
+        
+        while started < min(concurrency, num_requests):
+            start()
+            started += 1
+        
+        while selector.get_map():
+            now = time.perf_counter_ns()
+            deadline = min(key.data.deadline for key in selector.get_map().values())
+            for key, _ in selector.select(max(0, deadline - now) / 1e9):
+                probe = key.data
+                try:
+                    if probe.state == Probe.READING:
+                        if probe.on_readable():
+                            finish(probe)
+                    elif probe.on_writable():
+                        selector.modify(probe.sock, selectors.EVENT_READ, probe)
+                except OSError as e:
+                    finish(probe, str(e))
             
-            for future in as_completed(futures):
-                results.append(future.result())
-        
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        # Analyze results
-        successful = [r for r in results if r['success']]
-        failed = [r for r in results if not r['success']]
-        
-        if successful:
-            times = [r['total_time'] for r in successful]
-            avg_time = statistics.mean(times)
-            min_time = min(times)
-            max_time = max(times)
-            median_time = statistics.median(times)
+            # Past the deadline a connect or send is a failure; a read just ends
+            now = time.perf_counter_ns()
+            for key in list(selector.get_map().values()):
+                probe = key.data
+                if now >= probe.deadline:
+                    finish(probe, None if probe.state == Probe.READING else "timed out")
             
-            print(f"\n{Colors.GREEN}Success Rate: {len(successful)}/{num_requests} ({len(successful)/num_requests*100:.1f}%){Colors.RESET}")
+            while started < num_requests and len(selector.get_map()) < concurrency:
+                start()
+                started += 1
+        
+        selector.close()
+        return times, dict(errors)
+    
+    def concurrent_requests_test(self, num_requests=100, concurrency=10):
+        """Test concurrent request handling"""
+        print(f"\n{Colors.BOLD}Testing Concurrent Requests:{Colors.RESET}")
+        print(f"Requests: {num_requests}, Concurrency: {concurrency}")
+        
+        if self.processes > 1:
+            times, errors, duration = self._sharded_requests(num_requests, concurrency)
+        else:
+            start_time = time.perf_counter()
+            times, errors = self._drive_requests(GET_ROOT, num_requests, concurrency)
+            duration = time.perf_counter() - start_time
+        
+        if times:
+            print(f"\n{Colors.GREEN}Success Rate: {len(times)}/{num_requests} ({len(times)/num_requests*100:.1f}%){Colors.RESET}")
             print(f"Total Duration: {duration:.2f}s")
             print(f"Requests/sec: {num_requests/duration:.2f}")
-            print(f"\nResponse Times:")
-            print(f"  Average: {avg_time*1000:.2f}ms")
-            print(f"  Median:  {median_time*1000:.2f}ms")
-            print(f"  Min:     {min_time*1000:.2f}ms")
-            print(f"  Max:     {max_time*1000:.2f}ms")
-            
-            if len(times) > 1:
-                stdev = statistics.stdev(times)
-                print(f"  StdDev:  {stdev*1000:.2f}ms")
-        
-        if failed:
-            print(f"\n{Colors.RED}Failed Requests: {len(failed)}{Colors.RESET}")
-            error_types = {}
-            for f in failed:
-                error = f.get('error', 'Unknown')
-                error_types[error] = error_types.get(error, 0) + 1
-            for error, count in error_types.items():
+            self.print_response_times(times)
+        
+        if errors:
+            print(f"\n{Colors.RED}Failed Requests: {sum(errors.values())}{Colors.RESET}")
+            for error, count in errors.items():
                 print(f"  {error}: {count}")
         
-        return successful, failed
+        return times, errors
+    
+    @staticmethod
+    def print_response_times(times: Sequence[int]):
+        """Print latency statistics (given in ns), tail percentiles included, from one sort"""
+        ordered = sorted(times)
+        n = len(ordered)
+        # Integer nanoseconds keep the running sums exact, so the one-pass
+        # variance formula has no cancellation error
+        total = sum(ordered)
+        squares = sum(t * t for t in ordered)
+        
+        def percentile(q):
+            # Linear interpolation between closest ranks
+            rank = (n - 1) * q / 100
+            low = int(rank)
+            high = min(low + 1, n - 1)
+            return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+        
+        print(f"\nResponse Times:")
+        print(f"  Average: {total/n/1e6:.2f}ms")
+        print(f"  Median:  {percentile(50)/1e6:.2f}ms")
+        print(f"  Min:     {ordered[0]/1e6:.2f}ms")
+        print(f"  Max:     {ordered[-1]/1e6:.2f}ms")
+        for q in (90, 95, 99):
+            print(f"  p{q}:     {percentile(q)/1e6:.2f}ms")
+        
+        if n > 1:
+            stdev = math.sqrt((n * squares - total * total) / (n * (n - 1)))
+            print(f"  StdDev:  {stdev/1e6:.2f}ms")
+    
+    def _sharded_requests(self, num_requests: int, concurrency: int) -> Tuple[array.array, Dict[str, int], float]:
+        """Split the load across worker processes, each with its own selector loop"""
+        processes = min(self.processes, num_requests)
+        # Workers write their timings straight into one shared block of int64
+        # slots, each into its own slice; only small error tallies are pickled
+        block = shared_memory.SharedMemory(create=True, size=num_requests * 8)
+        shards = []
+        offset = 0
+        for i in range(processes):
+            count = num_requests // processes + (i < num_requests % processes)
+            shards.append((self.host, self.port, count, -(-concurrency // processes),
+                           block.name, offset))
+            offset += count
+        
+        try:
+            with multiprocessing.Pool(processes) as pool:
+                # Time only the requests, not spawning the workers
+                start_time = time.perf_counter()
+                shard_results = pool.starmap(_load_worker, shards)
+                duration = time.perf_counter() - start_time
+            
+            times = array.array('q')
+            errors = defaultdict(int)
+            slots = block.buf.cast('q')
+            for (_, _, _, _, _, offset), (succeeded, shard_errors) in zip(shards, shard_results):
+                times.extend(slots[offset:offset + succeeded])
+                for error, count in shard_errors.items():
+                    errors[error] += count
+            slots.release()
+        finally:
+            block.close()
+            block.unlink()
+        return times, dict(errors), duration
     
     def stress_test(self, duration_seconds=10):
         """Continuous stress test for specified duration"""
         print(f"\n{Colors.BOLD}Stress Test:{Colors.RESET}")
         print(f"Duration: {duration_seconds}s")
+        print("Connections: " + ("pooled keep-alive" if self.pool else "one per request"))
+        request = self._stress_request()
         
-        request = "GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
-        results = []
-        start_time = time.time()
+        # Keep only what the summary needs: success times and a failure count
+        times = array.array('q')
+        failed = 0
+        start_time = now = time.perf_counter()
+        deadline = start_time + duration_seconds
+        # Progress is redrawn a few times a second, not every N requests, so
+        # terminal writes don't eat into the measured rate
+        next_print = start_time + PROGRESS_INTERVAL
+        # The progress line is formatted as bytes and written to the binary
+        # stream under sys.stdout, skipping the text layer's encode
+        sys.stdout.flush()
+        out = getattr(sys.stdout, 'buffer', None)
         count = 0
         
-        while time.time() - start_time < duration_seconds:
-            result = self.send_single_request(request, timeout=2.0)
-            results.append(result)
+        while now < deadline:
+            t0 = time.perf_counter_ns()
+            try:
+                times.append(self._exchange(request, timeout=2.0, pooled=True)[2] - t0)
+            except Exception:
+                failed += 1
             count += 1
             
-            if count % 10 == 0:
-                elapsed = time.time() - start_time
-                rate = count / elapsed
-                print(f"\rProgress: {count} requests, {rate:.1f} req/s", end='')
+            now = time.perf_counter()
+            if now >= next_print:
+                rate = count / (now - start_time)
+                if out is not None:
+                    out.write(PROGRESS_FMT % (count, rate))
+                    out.flush()
+                else:
+                    print(f"\rProgress: {count} requests, {rate:.1f} req/s", end='', flush=True)
+                next_print = now + PROGRESS_INTERVAL
         
         print()
         
-        # Analyze results
-        successful = [r for r in results if r['success']]
-        failed = [r for r in results if not r['success']]
-        
         print(f"\n{Colors.GREEN}Total Requests: {count}{Colors.RESET}")
-        print(f"Successful: {len(successful)} ({len(successful)/count*100:.1f}%)")
-        print(f"Failed: {len(failed)} ({len(failed)/count*100:.1f}%)")
+        print(f"Successful: {len(times)} ({len(times)/count*100:.1f}%)")
+        print(f"Failed: {failed} ({failed/count*100:.1f}%)")
         print(f"Average Rate: {count/duration_seconds:.2f} req/s")
+        if times:
+            self.print_response_times(times)
         
-        return successful, failed
+        return times, failed
+    
+    def _stress_request(self) -> bytes:
+        """The GET / the stress loop repeats, keep-alive when pooling"""
+        return KEEPALIVE_ROOT if self.pool else GET_ROOT
     
-    def keep_alive_test(self, num_requests=50):
+    def keep_alive_test(self, num_requests=50, pipelined=False):
         """Test persistent connection handling"""
         print(f"\n{Colors.BOLD}Keep-Alive Test:{Colors.RESET}")
-        print(f"Sending {num_requests} sequential requests on single connection")
+        mode = "pipelined" if pipelined else "sequential"
+        print(f"Sending {num_requests} {mode} requests on single connection")
         
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(10.0)
-            sock.connect((self.host, self.port))
-            
-            successful = 0
-            failed = 0
-            times = []
+            sock = self._new_socket(10.0)
+            sock.connect(self._address)
             
-            for i in range(num_requests):
-                request = f"GET /index.html HTTP/1.1\r\nHost: localhost\r\nConnection: keep-alive\r\n\r\n"
-                
-                start = time.time()
-                try:
-                    sock.sendall(request.encode())
-                    
-                    response = b""
-                    while b'\r\n\r\n' not in response:
-                        chunk = sock.recv(4096)
-                        if not chunk:
-                            break
-                        response += chunk
-                    
-                    elapsed = time.time() - start
-                    times.append(elapsed)
-                    
-                    if response:
-                        successful += 1
-                    else:
-                        failed += 1
-                        break
-                        
-                except Exception as e:
-                    failed += 1
-                    print(f"\nError on request {i+1}: {e}")
-                    break
+            if pipelined:
+                successful, failed, times = self._pipelined_exchange(sock, num_requests)
+            else:
+                successful, failed, times = self._sequential_exchange(sock, num_requests)
             
             sock.close()
             
@@ -230,13 +549,83 @@ class PerformanceTester:
                 print(f"{Colors.RED}Failed: {failed}{Colors.RESET}")
             
             if times:
-                print(f"Average time: {statistics.mean(times)*1000:.2f}ms")
-                print(f"Min time: {min(times)*1000:.2f}ms")
-                print(f"Max time: {max(times)*1000:.2f}ms")
+                print(f"Average time: {statistics.fmean(times)/1e6:.2f}ms")
+                print(f"Min time: {min(times)/1e6:.2f}ms")
+                print(f"Max time: {max(times)/1e6:.2f}ms")
             
         except Exception as e:
             print(f"{Colors.RED}Keep-alive test failed: {e}{Colors.RESET}")
     
+    @staticmethod
+    def _sequential_exchange(sock: socket.socket, num_requests: int) -> Tuple[int, int, List[int]]:
+        """Send each request only after the previous response fully arrived"""
+        successful = 0
+        failed = 0
+        times = []
+        buf = bytearray()
+        
+        for i in range(num_requests):
+            start = time.perf_counter_ns()
+            try:
+                sock.sendall(KEEPALIVE_GET)
+                
+                # Read through the Content-Length body too, so its bytes are
+                # not taken for the start of the next response
+                end = response_end(buf)
+                while end is None:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    end = response_end(buf)
+                
+                times.append(time.perf_counter_ns() - start)
+                
+                if end is not None:
+                    successful += 1
+                    del buf[:end]
+                else:
+                    failed += 1
+                    break
+                    
+            except Exception as e:
+                failed += 1
+                print(f"\nError on request {i+1}: {e}")
+                break
+        
+        return successful, failed, times
+    
+    @staticmethod
+    def _pipelined_exchange(sock: socket.socket, num_requests: int) -> Tuple[int, int, List[int]]:
+        """Send every request in one write, then frame the responses as they arrive
+        
+        Each time is the gap since the previous response completed, so it
+        reflects the server's per-request cost rather than a loopback round trip.
+        """
+        times = []
+        buf = bytearray()
+        pos = 0
+        
+        last = time.perf_counter_ns()
+        try:
+            sock.sendall(KEEPALIVE_GET * num_requests)
+            while len(times) < num_requests:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                buf += chunk
+                end = response_end(buf, pos)
+                while end is not None and len(times) < num_requests:
+                    now = time.perf_counter_ns()
+                    times.append(now - last)
+                    last = now
+                    pos = end
+                    end = response_end(buf, pos)
+        except Exception as e:
+            print(f"\nError after {len(times)} responses: {e}")
+        
+        return len(times), num_requests - len(times), times
+    
     def large_file_test(self):
         """Test large file upload/download"""
         print(f"\n{Colors.BOLD}Large File Transfer Test:{Colors.RESET}")
@@ -245,12 +634,10 @@ class PerformanceTester:
         sizes = [1024, 10*1024, 100*1024, 1024*1024]  # 1KB to 1MB
         
         for size in sizes:
-            data = "x" * size
-            request = f"POST /uploads/ HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/octet-stream\r\nContent-Length: {size}\r\n\r\n{data}"
-            
-            start = time.time()
-            result = self.send_single_request(request, timeout=30.0)
-            elapsed = time.time() - start
+            # Only the header is built; the body is streamed in fixed blocks
+            start = time.perf_counter()
+            result = self.send_single_request(UPLOAD_HEAD % size, timeout=30.0, body_size=size)
+            elapsed = time.perf_counter() - start
             
             if result['success']:
                 rate = size / elapsed / 1024  # KB/s
@@ -263,11 +650,11 @@ class PerformanceTester:
         print(f"\n{Colors.BOLD}HTTP Methods Test:{Colors.RESET}")
         
         methods = [
-            ("GET", "GET / HTTP/1.1\r\nHost: localhost\r\n\r\n", [200]),
-            ("POST", "POST /uploads/ HTTP/1.1\r\nHost: localhost\r\nContent-Length: 4\r\n\r\ntest", [200, 201, 204]),
-            ("DELETE", "DELETE /uploads/test.txt HTTP/1.1\r\nHost: localhost\r\n\r\n", [200, 204, 404]),
-            ("HEAD", "HEAD / HTTP/1.1\r\nHost: localhost\r\n\r\n", [200, 501]),
-            ("PUT", "PUT /uploads/test.txt HTTP/1.1\r\nHost: localhost\r\nContent-Length: 4\r\n\r\ntest", [200, 201, 204, 405, 501]),
+            ("GET", b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n", [200]),
+            ("POST", b"POST /uploads/ HTTP/1.1\r\nHost: localhost\r\nContent-Length: 4\r\n\r\ntest", [200, 201, 204]),
+            ("DELETE", b"DELETE /uploads/test.txt HTTP/1.1\r\nHost: localhost\r\n\r\n", [200, 204, 404]),
+            ("HEAD", b"HEAD / HTTP/1.1\r\nHost: localhost\r\n\r\n", [200, 501]),
+            ("PUT", b"PUT /uploads/test.txt HTTP/1.1\r\nHost: localhost\r\nContent-Length: 4\r\n\r\ntest", [200, 201, 204, 405, 501]),
         ]
         
         for method, request, expected_codes in methods:
@@ -275,7 +662,7 @@ class PerformanceTester:
             status = result.get('status_code')
             
             if result['success'] and status in expected_codes:
-                print(f"{Colors.GREEN}✓{Colors.RESET} {method:7} - Status {status} ({result['total_time']*1000:.2f}ms)")
+                print(f"{Colors.GREEN}✓{Colors.RESET} {method:7} - Status {status} ({result['total_ns']/1e6:.2f}ms)")
             elif result['success']:
                 print(f"{Colors.YELLOW}~{Colors.RESET} {method:7} - Status {status} (expected one of {expected_codes})")
             else:
@@ -291,7 +678,7 @@ class PerformanceTester:
         
         # Check if server is running
         try:
-            test_result = self.send_single_request("GET / HTTP/1.1\r\nHost: localhost\r\n\r\n", timeout=5.0)
+            test_result = self.send_single_request(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n", timeout=5.0)
             if not test_result['success']:
                 print(f"{Colors.RED}ERROR: Cannot connect to server{Colors.RESET}")
                 return 1
@@ -300,13 +687,15 @@ class PerformanceTester:
             return 1
         
         print(f"{Colors.GREEN}✓ Server is running{Colors.RESET}\n")
+        self.report_socket_buffers()
+        self.warm_up()
         
         try:
             # Run tests
             self.method_variety_test()
-            self.concurrent_requests_test(num_requests=50, num_threads=10)
-            self.concurrent_requests_test(num_requests=100, num_threads=20)
-            self.keep_alive_test(num_requests=30)
+            self.concurrent_requests_test(num_requests=50, concurrency=10)
+            self.concurrent_requests_test(num_requests=100, concurrency=20)
+            self.keep_alive_test(num_requests=30, pipelined=self.pipeline)
             self.large_file_test()
             self.stress_test(duration_seconds=10)
             
@@ -320,19 +709,43 @@ class PerformanceTester:
             import traceback
             traceback.print_exc()
             return 1
+        finally:
+            if self.pool is not None:
+                self.pool.close()
         
         return 0
 
+def _load_worker(host: str, port: int, num_requests: int, concurrency: int,
+                 block_name: str, offset: int) -> Tuple[int, Dict[str, int]]:
+    """Run one shard of concurrent_requests_test in a worker process; its
+    success times go to the shared block at offset, the rest is returned"""
+    tester = PerformanceTester(host, port)
+    times, errors = tester._drive_requests(GET_ROOT, num_requests, concurrency)
+    block = shared_memory.SharedMemory(name=block_name)
+    slots = block.buf.cast('q')
+    slots[offset:offset + len(times)] = times
+    slots.release()
+    block.close()
+    return len(times), errors
+
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Performance and Load Tester for WebServ')
     parser.add_argument('--host', default='localhost', help='Server host')
     parser.add_argument('--port', type=int, default=8080, help='Server port')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='Worker processes for the concurrent tests (0 = one per CPU)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Pipeline the keep-alive requests instead of waiting for each response '
+                             '(needs a server that handles pipelined requests)')
+    parser.add_argument('--pool', action='store_true',
+                        help='Reuse keep-alive connections in the stress test instead of connecting per request')
     
     args = parser.parse_args()
     
-    tester = PerformanceTester(args.host, args.port)
+    tester = PerformanceTester(args.host, args.port, args.processes or os.cpu_count() or 1,
+                               args.pipeline, args.pool)
     exit_code = tester.run_all_tests()
     sys.exit(exit_code)
 
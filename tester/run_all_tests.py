@@ -8,6 +8,7 @@ import subprocess
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 class Colors:
@@ -21,11 +22,44 @@ class Colors:
     BOLD = '\033[1m'
     DIM = '\033[2m'
 
+_RULE = f"{Colors.BOLD}{Colors.CYAN}{'='*100}{Colors.RESET}"
+_SUITE_BANNER = f"\n{_RULE}\n{Colors.BOLD}{Colors.CYAN}Running: %s{Colors.RESET}\n{_RULE}\n\n"
+_TITLE_BANNER = (
+    f"\n{Colors.BOLD}{Colors.CYAN}╔{'═'*98}╗{Colors.RESET}\n"
+    f"{Colors.BOLD}{Colors.CYAN}║{' '*30}WEBSERV MASTER TEST RUNNER{' '*32}║{Colors.RESET}\n"
+    f"{Colors.BOLD}{Colors.CYAN}╚{'═'*98}╝{Colors.RESET}\n\n"
+)
+_SUMMARY_BANNER = f"\n{_RULE}\n{Colors.BOLD}{Colors.CYAN}MASTER TEST RUNNER - FINAL SUMMARY{Colors.RESET}\n{_RULE}\n\n"
+
+def _print_banner(description):
+    # One write per banner, flushed at the suite boundary: the suite about
+    # to run writes to the same stdout and must not overtake it
+    sys.stdout.write(_SUITE_BANNER % description)
+    sys.stdout.flush()
+
+def _report(description, returncode, duration):
+    """Print the completion line for a suite and map its exit code to 0/1"""
+    if returncode == 0:
+        print(f"\n{Colors.GREEN}✓ {description} completed successfully in {duration:.1f}s{Colors.RESET}")
+        return 0
+    else:
+        print(f"\n{Colors.YELLOW}⚠ {description} completed with failures in {duration:.1f}s{Colors.RESET}")
+        return 1
+
+# Keyword arguments that keep subprocess on CPython's posix_spawn fast path
+# instead of fork+exec: no cwd (main() chdirs once instead), no fd closing
+# sweep, no preexec_fn or new session
+_SPAWN_OPTIONS = {'close_fds': False}
+
+def _command(script_name, args=None):
+    cmd = [sys.executable, str(Path(__file__).parent / script_name)]
+    if args:
+        cmd.extend(args)
+    return cmd
+
 def run_tester(script_name, description, args=None):
     """Run a single tester script"""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*100}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}Running: {description}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'='*100}{Colors.RESET}\n")
+    _print_banner(description)
     
     script_path = Path(__file__).parent / script_name
     
@@ -33,22 +67,11 @@ def run_tester(script_name, description, args=None):
         print(f"{Colors.RED}ERROR: {script_name} not found{Colors.RESET}")
         return 1
     
-    cmd = [sys.executable, str(script_path)]
-    if args:
-        cmd.extend(args)
-    
     start_time = time.time()
     
     try:
-        result = subprocess.run(cmd, cwd=Path(__file__).parent)
-        duration = time.time() - start_time
-        
-        if result.returncode == 0:
-            print(f"\n{Colors.GREEN}✓ {description} completed successfully in {duration:.1f}s{Colors.RESET}")
-            return 0
-        else:
-            print(f"\n{Colors.YELLOW}⚠ {description} completed with failures in {duration:.1f}s{Colors.RESET}")
-            return 1
+        result = subprocess.run(_command(script_name, args), **_SPAWN_OPTIONS)
+        return _report(description, result.returncode, time.time() - start_time)
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Test interrupted by user{Colors.RESET}")
         return 1
@@ -56,6 +79,41 @@ def run_tester(script_name, description, args=None):
         print(f"\n{Colors.RED}ERROR running {script_name}: {e}{Colors.RESET}")
         return 1
 
+def _spawn(script_name, args=None):
+    """Run a tester script with its output captured; returns (returncode, output, duration)"""
+    if not (Path(__file__).parent / script_name).exists():
+        return 1, f"{Colors.RED}ERROR: {script_name} not found{Colors.RESET}\n", 0.0
+    
+    start_time = time.time()
+    result = subprocess.run(_command(script_name, args), stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, **_SPAWN_OPTIONS)
+    return result.returncode, result.stdout.decode('utf-8', errors='replace'), time.time() - start_time
+
+def run_testers_parallel(tests, args=None):
+    """Run tester scripts concurrently, printing each one's output whole as it finishes.
+    
+    The workers only wait on child processes, so threads are enough to
+    overlap them; output is captured per suite so it never interleaves.
+    """
+    outcome = {}
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(_spawn, script, args): description for script, description in tests}
+        for future in as_completed(futures):
+            description = futures[future]
+            _print_banner(description)
+            try:
+                returncode, output, duration = future.result()
+            except Exception as e:
+                print(f"\n{Colors.RED}ERROR running {description}: {e}{Colors.RESET}")
+                outcome[description] = 1
+                continue
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            outcome[description] = _report(description, returncode, duration)
+    
+    # Summary keeps the requested order, not completion order
+    return [(description, outcome[description]) for _, description in tests]
+
 def main():
     import argparse
     
@@ -74,6 +132,7 @@ Examples:
   %(prog)s --quick                  # Run only comprehensive and RFC tests
   %(prog)s --comprehensive          # Run only comprehensive tester
   %(prog)s --port 8081              # Test on different port
+  %(prog)s --parallel               # Run the selected suites concurrently
         """
     )
     
@@ -84,15 +143,19 @@ Examples:
     parser.add_argument('--rfc', action='store_true', help='Run only RFC compliance tester')
     parser.add_argument('--performance', action='store_true', help='Run only performance tester')
     parser.add_argument('--original', action='store_true', help='Run only original status tester')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Run the selected suites concurrently (performance numbers will be skewed)')
     
     args = parser.parse_args()
     
+    # Suites write their result files to the working directory; set it here
+    # once rather than per launch (see _SPAWN_OPTIONS)
+    os.chdir(Path(__file__).parent)
+    
     # Build common arguments
     common_args = ['--host', args.host, '--port', str(args.port)]
     
-    print(f"\n{Colors.BOLD}{Colors.CYAN}╔{'═'*98}╗{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}║{' '*30}WEBSERV MASTER TEST RUNNER{' '*32}║{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}╚{'═'*98}╝{Colors.RESET}\n")
+    sys.stdout.write(_TITLE_BANNER)
     
     print(f"{Colors.YELLOW}Testing server at {args.host}:{args.port}{Colors.RESET}")
     print(f"{Colors.DIM}Press Ctrl+C to interrupt any test{Colors.RESET}\n")
@@ -138,16 +201,17 @@ Examples:
             ]
         
         # Run each test
-        for script, description in tests:
-            result = run_tester(script, description, common_args)
-            results.append((description, result))
+        if args.parallel and len(tests) > 1:
+            results = run_testers_parallel(tests, common_args)
+        else:
+            for script, description in tests:
+                result = run_tester(script, description, common_args)
+                results.append((description, result))
         
         # Print final summary
         total_duration = time.time() - start_time
         
-        print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*100}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}MASTER TEST RUNNER - FINAL SUMMARY{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.CYAN}{'='*100}{Colors.RESET}\n")
+        sys.stdout.write(_SUMMARY_BANNER)
         
         passed = sum(1 for _, r in results if r == 0)
         failed = sum(1 for _, r in results if r != 0)
@@ -0,0 +1,28 @@
+"""
+Shared HTTP response parsing for the test scripts
+"""
+
+from typing import Optional
+
+# The status line is ASCII and short; nothing past this is ever examined
+STATUS_WINDOW = 48
+
+def parse_status(buf) -> Optional[int]:
+    """Status code at the start of a raw HTTP response, or None.
+
+    Accepts bytes, bytearray or a memoryview over either. Only the first
+    STATUS_WINDOW bytes are searched, so the cost doesn't depend on the body.
+    """
+    if isinstance(buf, memoryview):
+        buf = buf[:STATUS_WINDOW].tobytes()
+    end = buf.find(b"\n", 0, STATUS_WINDOW)
+    if end < 0:
+        end = min(len(buf), STATUS_WINDOW)
+    sp1 = buf.find(b" ", 0, end)
+    if sp1 < 0:
+        return None
+    sp2 = buf.find(b" ", sp1 + 1, end)
+    code = buf[sp1 + 1:sp2 if sp2 > 0 else end].strip()
+    if len(code) == 3 and code.isdigit():
+        return int(code)
+    return None
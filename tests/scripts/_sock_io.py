@@ -0,0 +1,26 @@
+"""
+Socket send helpers shared by the test scripts
+"""
+
+import socket
+from typing import List
+
+# Most iovec entries one sendmsg() call accepts (Linux IOV_MAX)
+IOV_MAX = 1024
+
+def sendall_iov(sock: socket.socket, buffers: List[bytes]):
+    """sendall() for a list of buffers, passed to the kernel as one iovec
+    instead of being joined first; falls back to joining without sendmsg"""
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(buffers))
+        return
+    views = [memoryview(b) for b in buffers if b]
+    first = 0
+    while first < len(views):
+        sent = sock.sendmsg(views[first:first + IOV_MAX])
+        # Skip the fully written buffers and trim a partially written one
+        while sent and sent >= len(views[first]):
+            sent -= len(views[first])
+            first += 1
+        if sent:
+            views[first] = views[first][sent:]
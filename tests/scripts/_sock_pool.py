@@ -0,0 +1,67 @@
+"""
+Keep-alive client socket pools shared by the test scripts
+"""
+
+import os
+import socket
+import threading
+from typing import Dict, List, Tuple
+
+class SockPool:
+    """Idle keep-alive sockets to one server, reused most-recent first"""
+
+    def __init__(self, host: str, port: int, size: int = 16):
+        self.host = host
+        self.port = port
+        self.size = size
+        self._free: List[socket.socket] = []
+        self._lock = threading.Lock()
+
+    def _new(self, timeout: float) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(timeout)
+        try:
+            sock.connect((self.host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def get(self, timeout: float = 5.0) -> Tuple[socket.socket, bool]:
+        """Return (socket, reused); reused sockets may have been dropped by the server"""
+        with self._lock:
+            sock = self._free.pop() if self._free else None
+        if sock is None:
+            return self._new(timeout), False
+        sock.settimeout(timeout)
+        return sock, True
+
+    def put(self, sock: socket.socket):
+        """Hand back a socket whose last response was read cleanly"""
+        with self._lock:
+            if len(self._free) < self.size:
+                self._free.append(sock)
+                return
+        sock.close()
+
+    def close(self):
+        with self._lock:
+            free, self._free = self._free, []
+        for sock in free:
+            sock.close()
+
+_pools: Dict[Tuple[int, str, int], SockPool] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(host: str, port: int, size: int = 16) -> SockPool:
+    """The pool for (host, port) in this process, created on first use.
+
+    Keyed by pid as well so a forked worker never shares its parent's sockets.
+    """
+    key = (os.getpid(), host, port)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SockPool(host, port, size)
+        return pool
@@ -4,13 +4,54 @@ Stress Test Suite for WebServ
 Tests server stability under heavy load
 """
 
+import asyncio
+import concurrent.futures
+import errno
+import functools
+import mmap
+import os
+import queue
+import selectors
 import socket
 import threading
 import time
 import random
+import re
 import string
+import struct
 import sys
-from typing import List
+from typing import Callable, Dict, List, Tuple
+
+from _http_parse import parse_status
+from _sock_io import sendall_iov
+
+# Linux clears TCP_QUICKACK again after each ACK, so it has to be re-armed
+# after every recv; elsewhere it does not exist and this is a no-op
+if hasattr(socket, "TCP_QUICKACK"):
+    def _quickack(sock: socket.socket):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+else:
+    def _quickack(sock: socket.socket):
+        pass
+
+# Header lookups anchored on the preceding CRLF, so they only match at the
+# start of a header line; searched within the head only
+CONTENT_LENGTH = re.compile(rb"(?i)\r\ncontent-length:[ \t]*(\d+)")
+CONNECTION_CLOSE = re.compile(rb"(?i)\r\nconnection:[ \t]*close")
+
+# SO_LINGER with a zero timeout: close() sends RST instead of FIN
+LINGER_RESET = struct.pack("ii", 1, 0)
+
+def _close_reset(sock: socket.socket):
+    """Close with RST rather than FIN, so the client end skips TIME_WAIT;
+    an abortive close, only for tests about connection churn or runs that
+    ask for it with --reset-close"""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RESET)
+    sock.close()
+
+# Request outcomes; workers count them in a private [ok, failed, timed out]
+# tally indexed by outcome, merged only once the workers are done
+OK, FAILED, TIMED_OUT = range(3)
 
 class Colors:
     GREEN = '\033[92m'
@@ -22,67 +63,385 @@ class Colors:
     BOLD = '\033[1m'
 
 class StressTester:
-    def __init__(self, host: str = "localhost", port: int = 8080):
+    def __init__(self, host: str = "localhost", port: int = 8080,
+                 keep_alive: bool = False, workers: int = 100, mode: str = "thread",
+                 pipeline: bool = False, workers_mode: str = "threads",
+                 reset_close: bool = False):
         self.host = host
         self.port = port
+        self.keep_alive = keep_alive
+        self.pipeline = pipeline
+        self.workers_mode = workers_mode
+        self.mode = mode
+        self.reset_close = reset_close
         self.success_count = 0
         self.failure_count = 0
         self.timeout_count = 0
-        self.lock = threading.Lock()
+        # One executor serves every test; idle keep-alive sockets are
+        # queued per worker thread so a connection never changes hands
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        self._idle: Dict[int, queue.Queue] = {}
+        self._payload_cache: Dict[int, mmap.mmap] = {}
+        self._local = threading.local()
+        self._req_cache: Dict[Tuple[str, str, bool], bytes] = {}
     
-    def make_request(self, path: str = "/", method: str = "GET", timeout: float = 5.0) -> bool:
-        """Make a single HTTP request and return success status"""
+    def close(self):
+        """Stop the worker threads, drop any idle keep-alive sockets and
+        unmap cached payloads"""
+        self.executor.shutdown(wait=True)
+        for idle in self._idle.values():
+            while not idle.empty():
+                self._close(idle.get_nowait())
+        self._idle.clear()
+        for payload in self._payload_cache.values():
+            payload.close()
+        self._payload_cache.clear()
+    
+    def _close(self, sock: socket.socket):
+        """Close a socket the client is done with: gracefully, or with RST
+        when reset_close is set"""
+        if self.reset_close:
+            _close_reset(sock)
+        else:
+            sock.close()
+    
+    def _payload(self, size_mb: int) -> mmap.mmap:
+        """A size_mb MiB body of b"X", built once per size in anonymous
+        shared memory: it is filled a block at a time without a full-size
+        temporary, sent straight through the buffer protocol, and a forked
+        worker process sees the same pages"""
+        payload = self._payload_cache.get(size_mb)
+        if payload is None:
+            payload = mmap.mmap(-1, size_mb * 1024 * 1024)
+            block = b"X" * 65536
+            for _ in range(len(payload) // len(block)):
+                payload.write(block)
+            self._payload_cache[size_mb] = payload
+        return payload
+    
+    def _new_sock(self, timeout: float) -> socket.socket:
+        """Connect a client socket with Nagle disabled, so small requests
+        are not held back waiting for the server's delayed ACK"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             sock.settimeout(timeout)
             sock.connect((self.host, self.port))
+        except Exception:
+            sock.close()
+            raise
+        return sock
+    
+    def _request(self, method: str, path: str, keep_alive: bool = False) -> bytes:
+        """Encoded request for method and path, built once per combination"""
+        key = (method, path, keep_alive)
+        request = self._req_cache.get(key)
+        if request is None:
+            connection = "Connection: keep-alive\r\n" if keep_alive else ""
+            request = self._req_cache[key] = (
+                f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n{connection}\r\n").encode()
+        return request
+    
+    def _rxbuf(self) -> bytearray:
+        """This thread's scratch receive buffer, allocated on first use"""
+        rx = getattr(self._local, "rx", None)
+        if rx is None:
+            rx = self._local.rx = bytearray(4096)
+        return rx
+    
+    def _read_response(self, sock: socket.socket, buf: bytearray,
+                       ack: bool = False) -> Tuple[int, bool]:
+        """Read one Content-Length framed response into buf, scanning each
+        byte once. Returns where the response ends in buf, since pipelined
+        responses can arrive together and anything after it belongs to the
+        next one, and whether the connection can carry another request.
+        If recv raises, buf still holds whatever arrived before it did"""
+        rx = memoryview(self._rxbuf())
+        header_end = buf.find(b"\r\n\r\n")
+        while header_end < 0:
+            start = max(0, len(buf) - 3)
+            received = sock.recv_into(rx)
+            if not received:
+                return len(buf), False
+            if ack:
+                _quickack(sock)
+            buf += rx[:received]
+            header_end = buf.find(b"\r\n\r\n", start)
+        header_end += 4
+        
+        match = CONTENT_LENGTH.search(buf, 0, header_end)
+        if match is None:
+            return len(buf), False
+        end = header_end + int(match.group(1))
+        
+        # Grow once to the full length and receive the body in place
+        offset = len(buf)
+        if offset < end:
+            buf.extend(bytes(end - offset))
+            view = memoryview(buf)
+            try:
+                while offset < end:
+                    received = sock.recv_into(view[offset:end])
+                    if not received:
+                        break
+                    if ack:
+                        _quickack(sock)
+                    offset += received
+            finally:
+                view.release()
+                del buf[offset:]
+            if offset < end:
+                return offset, False
+        return end, CONNECTION_CLOSE.search(buf, 0, header_end) is None
+    
+    def _merge(self, tallies: List[List[int]]):
+        """Fold per-worker tallies into the shared counters"""
+        self.success_count = sum(tally[OK] for tally in tallies)
+        self.timeout_count = sum(tally[TIMED_OUT] for tally in tallies)
+        self.failure_count = sum(tally[FAILED] for tally in tallies) + self.timeout_count
+    
+    def make_request(self, path: str = "/", method: str = "GET", timeout: float = 5.0) -> bool:
+        """Make a single HTTP request and return success status"""
+        return self._attempt(path, method, timeout) == OK
+    
+    def _attempt(self, path: str = "/", method: str = "GET", timeout: float = 5.0) -> int:
+        """Make a single HTTP request and return its outcome"""
+        if self.keep_alive:
+            return self._send_pooled(self._request(method, path, keep_alive=True), timeout)
+        return self._send_fresh(self._request(method, path), timeout)
+    
+    def specialize(self, method: str = "GET", path: str = "/") -> Callable[..., int]:
+        """_attempt for one fixed method and path, taking only the timeout;
+        the request bytes and the keep-alive choice are bound up front"""
+        if self.keep_alive:
+            return functools.partial(self._send_pooled, self._request(method, path, keep_alive=True))
+        return functools.partial(self._send_fresh, self._request(method, path))
+    
+    def _send_fresh(self, request: bytes, timeout: float = 5.0) -> int:
+        """Send request on a new connection and judge the first read"""
+        try:
+            sock = self._new_sock(timeout)
             
-            request = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n\r\n"
-            sock.sendall(request.encode())
+            sock.sendall(request)
             
-            response = sock.recv(4096)
-            sock.close()
+            rx = self._rxbuf()
+            received = sock.recv_into(rx)
+            self._close(sock)
             
-            if response and b"HTTP" in response:
-                return True
-            return False
+            if received and rx.startswith(b"HTTP", 0, received):
+                return OK
+            return FAILED
             
         except socket.timeout:
-            with self.lock:
-                self.timeout_count += 1
-            return False
-        except Exception as e:
-            return False
+            return TIMED_OUT
+        except Exception:
+            return FAILED
+    
+    def _send_pooled(self, request: bytes, timeout: float = 5.0) -> int:
+        """Send request on this thread's idle keep-alive socket, or a new one"""
+        idle = self._idle.setdefault(threading.get_ident(), queue.Queue())
+        
+        # A pooled socket may have been closed by the server while idle;
+        # that costs one retry on a fresh connection, not a failure
+        while True:
+            try:
+                sock, reused = idle.get_nowait(), True
+            except queue.Empty:
+                sock, reused = None, False
+            try:
+                if sock is None:
+                    sock = self._new_sock(timeout)
+                else:
+                    sock.settimeout(timeout)
+                sock.sendall(request)
+                response = bytearray()
+                _, reusable = self._read_response(sock, response)
+            except socket.timeout:
+                if sock is not None:
+                    sock.close()
+                return TIMED_OUT
+            except Exception:
+                if sock is not None:
+                    sock.close()
+                if reused:
+                    continue
+                return FAILED
+            
+            if not response and reused:
+                sock.close()
+                continue
+            if reusable:
+                idle.put(sock)
+            else:
+                sock.close()
+            return OK if b"HTTP" in response else FAILED
+    
+    async def _areq(self, path: str = "/", method: str = "GET", timeout: float = 5.0) -> int:
+        """Event-loop counterpart of _attempt, always on a fresh connection"""
+        writer = None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout)
+            writer.write(self._request(method, path))
+            response = await asyncio.wait_for(reader.read(4096), timeout)
+            return OK if b"HTTP" in response else FAILED
+        except asyncio.TimeoutError:
+            return TIMED_OUT
+        except Exception:
+            return FAILED
+        finally:
+            if writer is not None:
+                if self.reset_close:
+                    writer.get_extra_info("socket").setsockopt(
+                        socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RESET)
+                writer.close()
+    
+    def _run_threads(self, worker, tallies: List[List[int]], duration: float):
+        """Run one copy of the worker function per tally on the executor for
+        duration seconds; each gets the tally and a threading.Event to stop
+        on. Requests still in flight are bounded by their socket timeouts, so
+        every worker is waited for and its tally is final on return"""
+        stop = threading.Event()
+        futures = [self.executor.submit(worker, tally, stop) for tally in tallies]
+        try:
+            time.sleep(duration)
+        except KeyboardInterrupt:
+            print(f"\n{Colors.YELLOW}Test interrupted{Colors.RESET}")
+        stop.set()
+        concurrent.futures.wait(futures)
+    
+    def _run_async(self, worker, tallies: List[List[int]], duration: float):
+        """Run one copy of the worker coroutine per tally for duration
+        seconds; each gets the tally and an asyncio.Event to stop on"""
+        async def run():
+            stop = asyncio.Event()
+            tasks = [asyncio.create_task(worker(tally, stop)) for tally in tallies]
+            await asyncio.sleep(duration)
+            # wait_for can swallow a cancel that lands just as the request
+            # it wraps completes, so workers also stop at the next iteration
+            stop.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        try:
+            asyncio.run(run())
+        except KeyboardInterrupt:
+            print(f"\n{Colors.YELLOW}Test interrupted{Colors.RESET}")
+    
+    def _select_requests(self, total: int, in_flight: int, timeout: float = 5.0) -> List[int]:
+        """Drive total GET / requests from this one thread with a selector,
+        keeping up to in_flight fresh connections open at once; the checks
+        match make_request. Returns an [ok, failed, timed out] tally"""
+        tally = [0, 0, 0]
+        request = self._request("GET", "/")
+        rx = self._rxbuf()
+        addr = socket.getaddrinfo(self.host, self.port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+        sel = selectors.DefaultSelector()
+        deadlines: Dict[socket.socket, float] = {}
+        pending = total
+        
+        def launch():
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if sock.connect_ex(addr) not in (0, errno.EINPROGRESS):
+                sock.close()
+                tally[FAILED] += 1
+                return
+            sel.register(sock, selectors.EVENT_WRITE)
+            deadlines[sock] = time.monotonic() + timeout
+        
+        def finish(sock, outcome):
+            sel.unregister(sock)
+            del deadlines[sock]
+            self._close(sock)
+            tally[outcome] += 1
+        
+        try:
+            while pending or deadlines:
+                while pending and len(deadlines) < in_flight:
+                    pending -= 1
+                    launch()
+                if not deadlines:
+                    continue
+                
+                wait = max(0.0, min(deadlines.values()) - time.monotonic())
+                for key, events in sel.select(wait):
+                    sock = key.fileobj
+                    if key.events == selectors.EVENT_WRITE:
+                        # Writable means the connect finished, one way or the other
+                        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                            finish(sock, FAILED)
+                            continue
+                        try:
+                            sock.send(request)
+                        except OSError:
+                            finish(sock, FAILED)
+                            continue
+                        sel.modify(sock, selectors.EVENT_READ)
+                    else:
+                        try:
+                            received = sock.recv_into(rx)
+                        except BlockingIOError:
+                            continue
+                        except OSError:
+                            finish(sock, FAILED)
+                            continue
+                        ok = received and rx.startswith(b"HTTP", 0, received)
+                        finish(sock, OK if ok else FAILED)
+                
+                now = time.monotonic()
+                for sock in [sock for sock, deadline in deadlines.items() if deadline <= now]:
+                    finish(sock, TIMED_OUT)
+        finally:
+            for sock in list(deadlines):
+                sel.unregister(sock)
+                sock.close()
+            sel.close()
+        return tally
+    
+    def _concurrent_tally(self, total: int, in_flight: int) -> List[int]:
+        """Make total GET / requests, in_flight at a time, and return the tally"""
+        if not self.keep_alive:
+            return self._select_requests(total, in_flight)
+        
+        # Reused sockets belong to executor threads, so keep-alive runs
+        # there; the executor caps concurrency at its worker count, and
+        # in_flight beyond that only deepens the queue
+        attempt = self.specialize("GET", "/")
+        futures = [self.executor.submit(attempt) for _ in range(total)]
+        concurrent.futures.wait(futures)
+        
+        tally = [0, 0, 0]
+        for future in futures:
+            tally[future.result()] += 1
+        return tally
     
     def concurrent_requests_test(self, num_threads: int = 100, requests_per_thread: int = 10):
         """Test with many concurrent connections"""
         print(f"\n{Colors.BOLD}Concurrent Requests Test{Colors.RESET}")
-        print(f"Threads: {num_threads}, Requests per thread: {requests_per_thread}")
+        print(f"Concurrency: {num_threads}, Requests per slot: {requests_per_thread}")
         print(f"Total requests: {num_threads * requests_per_thread}")
         
-        self.success_count = 0
-        self.failure_count = 0
-        self.timeout_count = 0
-        
-        def worker():
-            for _ in range(requests_per_thread):
-                if self.make_request():
-                    with self.lock:
-                        self.success_count += 1
-                else:
-                    with self.lock:
-                        self.failure_count += 1
-        
         start_time = time.time()
         
-        threads = []
-        for _ in range(num_threads):
-            thread = threading.Thread(target=worker)
-            thread.start()
-            threads.append(thread)
-        
-        for thread in threads:
-            thread.join()
+        total = num_threads * requests_per_thread
+        if self.workers_mode == "processes":
+            # Split both the requests and the concurrency across one
+            # process per CPU, so client-side Python work isn't bound by
+            # a single GIL
+            procs = min(os.cpu_count() or 1, num_threads)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=procs) as pool:
+                futures = [pool.submit(_worker_make_requests, self.host, self.port, self.keep_alive,
+                                       total // procs + (n < total % procs),
+                                       num_threads // procs + (n < num_threads % procs),
+                                       self.reset_close)
+                           for n in range(procs)]
+                self._merge([future.result() for future in futures])
+        else:
+            self._merge([self._concurrent_tally(total, num_threads)])
         
         elapsed = time.time() - start_time
         total = self.success_count + self.failure_count
@@ -109,39 +468,28 @@ class StressTester:
         print(f"\n{Colors.BOLD}Sustained Load Test{Colors.RESET}")
         print(f"Duration: {duration}s, Target rate: {rps} req/s")
         
-        self.success_count = 0
-        self.failure_count = 0
-        self.timeout_count = 0
-        running = True
+        tallies = [[0, 0, 0] for _ in range(10)]  # Use 10 workers
         
-        def worker():
-            while running:
-                if self.make_request(timeout=3.0):
-                    with self.lock:
-                        self.success_count += 1
-                else:
-                    with self.lock:
-                        self.failure_count += 1
-                time.sleep(1.0 / rps)
+        attempt = self.specialize("GET", "/")
         
-        start_time = time.time()
+        def worker(tally, stop):
+            while not stop.is_set():
+                tally[attempt(timeout=3.0)] += 1
+                stop.wait(1.0 / rps)
         
-        threads = []
-        for _ in range(10):  # Use 10 worker threads
-            thread = threading.Thread(target=worker)
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
+        async def async_worker(tally, stop):
+            while not stop.is_set():
+                tally[await self._areq(timeout=3.0)] += 1
+                await asyncio.sleep(1.0 / rps)
         
-        # Monitor for duration
-        try:
-            time.sleep(duration)
-        except KeyboardInterrupt:
-            print(f"\n{Colors.YELLOW}Test interrupted{Colors.RESET}")
+        start_time = time.time()
         
-        running = False
-        time.sleep(2)  # Let threads finish
+        if self.mode == "async":
+            self._run_async(async_worker, tallies, duration)
+        else:
+            self._run_threads(worker, tallies, duration)
         
+        self._merge(tallies)
         elapsed = time.time() - start_time
         total = self.success_count + self.failure_count
         
@@ -165,53 +513,45 @@ class StressTester:
     def connection_reuse_test(self, num_requests: int = 100):
         """Test connection reuse with keep-alive"""
         print(f"\n{Colors.BOLD}Connection Reuse Test{Colors.RESET}")
-        print(f"Requests: {num_requests}")
+        print(f"Requests: {num_requests}{' (pipelined)' if self.pipeline else ''}")
         
         success = 0
         failures = 0
         
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5.0)
-            sock.connect((self.host, self.port))
+            sock = self._new_sock(5.0)
             
+            requests = [f"GET /?req={i} HTTP/1.1\r\nHost: {self.host}\r\nConnection: keep-alive\r\n\r\n".encode()
+                        for i in range(num_requests)]
+            if self.pipeline:
+                # Everything goes out before the first read; responses are
+                # then split off the front of one stream buffer
+                sock.sendall(b"".join(requests))
+            
+            response = bytearray()
             for i in range(num_requests):
-                request = f"GET /?req={i} HTTP/1.1\r\nHost: {self.host}\r\nConnection: keep-alive\r\n\r\n"
-                sock.sendall(request.encode())
+                if not self.pipeline:
+                    sock.sendall(requests[i])
                 
                 # Read response
-                response = b""
                 try:
-                    while True:
-                        chunk = sock.recv(4096)
-                        if not chunk:
-                            break
-                        response += chunk
-                        if b"\r\n\r\n" in response:
-                            # Got headers, check for body
-                            if b"Content-Length:" in response:
-                                # Parse content length and read body
-                                headers = response.split(b"\r\n\r\n")[0]
-                                for line in headers.split(b"\r\n"):
-                                    if b"Content-Length:" in line:
-                                        length = int(line.split(b":")[1].strip())
-                                        body_start = response.find(b"\r\n\r\n") + 4
-                                        body = response[body_start:]
-                                        while len(body) < length:
-                                            body += sock.recv(4096)
-                                        break
-                            break
+                    end, _ = self._read_response(sock, response, ack=True)
+                    timed_out = False
                 except socket.timeout:
-                    pass
+                    end, timed_out = len(response), True
                 
-                if response and b"200" in response:
+                if response and parse_status(response) == 200:
                     success += 1
                 else:
                     failures += 1
+                del response[:end]
                 
-                time.sleep(0.01)  # Small delay between requests
+                if timed_out and self.pipeline:
+                    # Nothing queued behind a stalled response will arrive
+                    failures += num_requests - i - 1
+                    break
             
-            sock.close()
+            self._close(sock)
             
         except Exception as e:
             print(f"{Colors.RED}Connection error: {str(e)}{Colors.RESET}")
@@ -236,43 +576,36 @@ class StressTester:
         print(f"\n{Colors.BOLD}Large Payload Test{Colors.RESET}")
         print(f"Payload size: {size_mb}MB, Requests: {num_requests}")
         
-        payload = "X" * (size_mb * 1024 * 1024)
+        payload = self._payload(size_mb)
         success = 0
         failures = 0
         
+        request_header = (
+            f"POST /uploads HTTP/1.1\r\n"
+            f"Host: {self.host}\r\n"
+            f"Content-Type: application/octet-stream\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"\r\n"
+        ).encode()
+        
         for i in range(num_requests):
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(15.0)
-                sock.connect((self.host, self.port))
-                
-                request_header = (
-                    f"POST /uploads HTTP/1.1\r\n"
-                    f"Host: {self.host}\r\n"
-                    f"Content-Type: application/octet-stream\r\n"
-                    f"Content-Length: {len(payload)}\r\n"
-                    f"\r\n"
-                )
+                sock = self._new_sock(15.0)
                 
-                sock.sendall(request_header.encode())
+                # Head and payload leave in one gathered write, without
+                # being joined into a second copy of the payload first
+                sendall_iov(sock, [request_header, payload])
                 
-                # Send payload in chunks
-                chunk_size = 65536
-                sent = 0
-                while sent < len(payload):
-                    chunk = payload[sent:sent+chunk_size]
-                    sock.sendall(chunk.encode())
-                    sent += len(chunk)
+                rx = self._rxbuf()
+                received = sock.recv_into(rx)
+                self._close(sock)
                 
-                response = sock.recv(4096)
-                sock.close()
-                
-                if response and (b"200" in response or b"201" in response or b"413" in response):
+                if received and parse_status(memoryview(rx)[:received]) in (200, 201, 413):
                     success += 1
                 else:
                     failures += 1
                     
-            except Exception as e:
+            except Exception:
                 failures += 1
             
             print(f"  Progress: {i+1}/{num_requests}", end='\r')
@@ -293,6 +626,15 @@ class StressTester:
             print(f"{Colors.RED}✗ FAIL{Colors.RESET}: Issues with large payloads")
             return False
     
+    def _connect_and_close(self, _=None) -> bool:
+        """Open a connection and reset it straight away"""
+        try:
+            sock = self._new_sock(2.0)
+        except Exception:
+            return False
+        _close_reset(sock)
+        return True
+    
     def rapid_connect_disconnect_test(self, num_connections: int = 500):
         """Test rapid connection establishment and closing"""
         print(f"\n{Colors.BOLD}Rapid Connect/Disconnect Test{Colors.RESET}")
@@ -303,14 +645,13 @@ class StressTester:
         
         start_time = time.time()
         
-        for i in range(num_connections):
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(2.0)
-                sock.connect((self.host, self.port))
-                sock.close()
+        # Fan out over the executor so accept() sees parallel arrivals
+        # instead of one round trip at a time
+        results = self.executor.map(self._connect_and_close, range(num_connections))
+        for i, connected in enumerate(results):
+            if connected:
                 success += 1
-            except:
+            else:
                 failures += 1
             
             if (i + 1) % 50 == 0:
@@ -340,42 +681,45 @@ class StressTester:
         print(f"\n{Colors.BOLD}Mixed Workload Test{Colors.RESET}")
         print(f"Duration: {duration}s")
         
-        self.success_count = 0
-        self.failure_count = 0
-        running = True
+        tallies = [[0, 0, 0] for _ in range(20)]
         
         paths = ["/", "/index.html", "/test.html", "/cgi-bin/test.py"]
         methods = ["GET", "GET", "GET", "POST"]  # More GETs than POSTs
-        
-        def worker():
-            while running:
-                path = random.choice(paths)
-                method = random.choice(methods)
-                if self.make_request(path, method, timeout=3.0):
-                    with self.lock:
-                        self.success_count += 1
-                else:
-                    with self.lock:
-                        self.failure_count += 1
-                time.sleep(random.uniform(0.01, 0.1))
+        attempts = {(method, path): self.specialize(method, path)
+                    for method in set(methods) for path in paths}
+        
+        # Draw the whole mix up front: workers walk a shared read-only deck
+        # from their own random offset instead of contending on the module
+        # PRNG's lock twice per request
+        deck = []
+        for _ in range(0x10000):
+            method, path = random.choice(methods), random.choice(paths)
+            deck.append((method, path, attempts[method, path], random.uniform(0.01, 0.1)))
+        
+        def worker(tally, stop):
+            i = random.randrange(0x10000)
+            while not stop.is_set():
+                _, _, attempt, pause = deck[i & 0xFFFF]
+                i += 1
+                tally[attempt(timeout=3.0)] += 1
+                stop.wait(pause)
+        
+        async def async_worker(tally, stop):
+            i = random.randrange(0x10000)
+            while not stop.is_set():
+                method, path, _, pause = deck[i & 0xFFFF]
+                i += 1
+                tally[await self._areq(path, method, timeout=3.0)] += 1
+                await asyncio.sleep(pause)
         
         start_time = time.time()
         
-        threads = []
-        for _ in range(20):
-            thread = threading.Thread(target=worker)
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-        
-        try:
-            time.sleep(duration)
-        except KeyboardInterrupt:
-            print(f"\n{Colors.YELLOW}Test interrupted{Colors.RESET}")
-        
-        running = False
-        time.sleep(2)
+        if self.mode == "async":
+            self._run_async(async_worker, tallies, duration)
+        else:
+            self._run_threads(worker, tallies, duration)
         
+        self._merge(tallies)
         elapsed = time.time() - start_time
         total = self.success_count + self.failure_count
         
@@ -405,7 +749,7 @@ class StressTester:
         results = []
         
         # Run tests
-        results.append(("Concurrent Requests (100 threads)", self.concurrent_requests_test(100, 10)))
+        results.append(("Concurrent Requests (100 in flight)", self.concurrent_requests_test(100, 10)))
         results.append(("Sustained Load (30s)", self.sustained_load_test(30, 30)))
         results.append(("Connection Reuse", self.connection_reuse_test(50)))
         results.append(("Large Payloads", self.large_payload_test(1, 5)))
@@ -427,33 +771,54 @@ class StressTester:
         print(f"\nTotal: {passed}/{total} passed")
         print(f"{'='*60}\n")
         
+        self.close()
         return passed == total
 
+def _worker_make_requests(host: str, port: int, keep_alive: bool,
+                          total: int, in_flight: int, reset_close: bool = False) -> List[int]:
+    """One process's share of the concurrent test, as an [ok, failed,
+    timed out] tally; module level so a process pool can pickle it"""
+    tester = StressTester(host, port, keep_alive=keep_alive, workers=max(in_flight, 1),
+                          reset_close=reset_close)
+    try:
+        return tester._concurrent_tally(total, in_flight)
+    finally:
+        tester.close()
+
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='WebServ Stress Tester')
     parser.add_argument('--host', default='localhost', help='Server host')
     parser.add_argument('--port', type=int, default=8080, help='Server port')
+    parser.add_argument('--keep-alive', action='store_true',
+                        help='Reuse connections across requests (server must support keep-alive)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Send all connection reuse requests before reading (server must support pipelining)')
+    parser.add_argument('--workers-mode', choices=('threads', 'processes'), default='threads',
+                        help='Run the concurrent test in this process or spread it over one process per CPU')
+    parser.add_argument('--mode', choices=('thread', 'async'), default='thread',
+                        help='Drive the sustained and mixed workloads from threads or an event loop')
+    parser.add_argument('--reset-close', action='store_true',
+                        help='Close every connection with RST instead of FIN, so long runs leave no ports in TIME_WAIT')
     
     args = parser.parse_args()
     
+    tester = StressTester(args.host, args.port, keep_alive=args.keep_alive,
+                          mode=args.mode, pipeline=args.pipeline,
+                          workers_mode=args.workers_mode, reset_close=args.reset_close)
+    
     # Check if server is running
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2.0)
-        result = sock.connect_ex((args.host, args.port))
-        sock.close()
-        
-        if result != 0:
-            print(f"{Colors.RED}Error: Server not running on {args.host}:{args.port}{Colors.RESET}")
-            sys.exit(1)
+        tester._new_sock(2.0).close()
+    except (ConnectionRefusedError, socket.timeout):
+        print(f"{Colors.RED}Error: Server not running on {args.host}:{args.port}{Colors.RESET}")
+        sys.exit(1)
     except Exception as e:
         print(f"{Colors.RED}Error: {str(e)}{Colors.RESET}")
         sys.exit(1)
     
     # Run tests
-    tester = StressTester(args.host, args.port)
     success = tester.run_all_stress_tests()
     
     sys.exit(0 if success else 1)